@@ -0,0 +1,56 @@
+"""Mede o tempo de inicialização da aplicação (import + create_app).
+
+Cada amostra roda num interpretador novo, como um worker do gunicorn ou um
+comando `flask ...` faria. Uso:
+
+    python benchmarks/startup.py [--amostras 10] [--cli]
+
+Com --cli simula o carregamento pelo CLI do Flask (que também carrega o Migrate).
+"""
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+MEDICAO = """
+import time
+inicio = time.perf_counter()
+import diario
+fim_import = time.perf_counter()
+diario.create_app()
+fim = time.perf_counter()
+print(fim_import - inicio, fim - inicio)
+"""
+
+
+def medir(amostras, cli):
+    env = dict(os.environ)
+    env.pop('FLASK_RUN_FROM_CLI', None)
+    env.setdefault('SECRET_KEY', 'benchmark')
+    if cli:
+        env['FLASK_RUN_FROM_CLI'] = 'true'
+    tempos_import, tempos_total = [], []
+    for _ in range(amostras):
+        saida = subprocess.run([sys.executable, '-c', MEDICAO], cwd=RAIZ_PROJETO, env=env,
+                               capture_output=True, text=True, check=True).stdout
+        t_import, t_total = map(float, saida.split())
+        tempos_import.append(t_import); tempos_total.append(t_total)
+    return tempos_import, tempos_total
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--amostras', type=int, default=10)
+    parser.add_argument('--cli', action='store_true')
+    args = parser.parse_args()
+    tempos_import, tempos_total = medir(args.amostras, args.cli)
+    for nome, tempos in (('import diario', tempos_import), ('create_app()', tempos_total)):
+        print(f"{nome:<15} mediana {statistics.median(tempos) * 1000:7.1f} ms   "
+              f"min {min(tempos) * 1000:7.1f} ms   max {max(tempos) * 1000:7.1f} ms")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,56 @@
+# --- Fábrica da Aplicação ---
+import os
+from datetime import datetime, timedelta
+
+from flask import Flask
+
+from .assets import init_assets
+from .config import config_por_nome
+from .extensions import db, login_manager, init_migrate
+from .limites import init_limites
+
+# templates/ e static/ ficam na raiz do projeto, fora do pacote
+RAIZ_PROJETO = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+def create_app(config_name=None):
+    app = Flask(
+        __name__,
+        template_folder=os.path.join(RAIZ_PROJETO, 'templates'),
+        static_folder=os.path.join(RAIZ_PROJETO, 'static'),
+    )
+    app.config.from_object(config_por_nome[config_name or os.environ.get('FLASK_CONFIG', 'production')])
+    if not app.config['SECRET_KEY']:
+        # Sem chave própria qualquer um forjaria os cookies de sessão e "lembrar-me"
+        raise RuntimeError('Defina a variável de ambiente SECRET_KEY (obrigatória em produção).')
+    init_assets(app)
+    init_limites(app)
+
+    db.init_app(app)
+    login_manager.init_app(app)
+    # Workers do gunicorn nunca pagam o import do Alembic; só os comandos `flask ...`
+    if os.environ.get('FLASK_RUN_FROM_CLI') == 'true':
+        init_migrate(app)
+
+    from . import models  # noqa: F401  (registra os models e o user_loader)
+    from .jobs import init_jobs
+    from .arquivo import init_arquivo
+    init_jobs(app)
+    init_arquivo(app)
+    from .routes import blueprints
+    for bp in blueprints:
+        app.register_blueprint(bp)
+
+    app.add_template_filter(format_datetime_local, 'local_time')
+    app.context_processor(inject_now)
+    return app
+
+
+# --- Filtro Jinja Personalizado para Horário Local ---
+def format_datetime_local(dt, fmt='%H:%M'):
+    if dt is None: return ''
+    dt_local = dt - timedelta(hours=3) # Ajuste se necessário
+    return dt_local.strftime(fmt)
+
+def inject_now():
+    return {'now': datetime.utcnow}
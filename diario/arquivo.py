@@ -0,0 +1,184 @@
+# --- Arquivo de Treinos Antigos ---
+# Treinos finalizados há mais de ARQUIVO_IDADE_DIAS são compactados num único
+# TreinoArquivado (ids dos exercícios + listas de repetições e pesos) e suas linhas
+# de exercicio_registrado/serie saem das tabelas quentes. As rotas de leitura
+# (inclusive ver_treino) combinam as duas fontes com as funções abaixo sem
+# restaurar nada; só `add_exercicio_reg` e `flask arquivo restaurar` chamam
+# `restaurar_treino()`, devolvendo o treino às tabelas normais.
+import json
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+from flask.cli import AppGroup
+from sqlalchemy.orm import joinedload
+
+from .extensions import db
+from .jobs import tarefa, enfileirar
+from .models import Exercicio, ExercicioRegistrado, Serie, Treino, TreinoArquivado, TreinoArquivadoExercicio
+
+
+class RegistroArquivado:
+    """Imita um ExercicioRegistrado (só leitura) para templates e cálculos."""
+
+    def __init__(self, treino, id_exercicio, observacoes, exercicio=None):
+        self.treino = treino
+        self.id_exercicio = id_exercicio
+        self.observacoes = observacoes
+        self.exercicio = exercicio
+        self.series = []
+
+
+class SerieArquivada:
+    def __init__(self, registro, numero_serie, repeticoes, peso_kg):
+        self.exercicio_registrado = registro
+        self.numero_serie = numero_serie
+        self.repeticoes = repeticoes
+        self.peso_kg = peso_kg
+
+
+# --- Compactação ---
+def empacotar(treino):
+    exercicios = []
+    for ex_reg in sorted(treino.exercicios_registrados, key=lambda e: e.id):
+        series = sorted(ex_reg.series, key=lambda s: (s.numero_serie, s.id))
+        exercicios.append({
+            'id_exercicio': ex_reg.id_exercicio,
+            'observacoes': ex_reg.observacoes,
+            'repeticoes': [s.repeticoes for s in series],
+            'pesos': [s.peso_kg for s in series],
+        })
+    return json.dumps({'exercicios': exercicios}, separators=(',', ':'))
+
+
+def desempacotar(treino, exercicios_por_id=None, id_exercicio=None):
+    """Lista de RegistroArquivado do treino (opcionalmente só de um exercício)."""
+    registros = []
+    for item in json.loads(treino.arquivo.dados)['exercicios']:
+        if id_exercicio is not None and item['id_exercicio'] != id_exercicio:
+            continue
+        exercicio = exercicios_por_id.get(item['id_exercicio']) if exercicios_por_id else None
+        registro = RegistroArquivado(treino, item['id_exercicio'], item['observacoes'], exercicio)
+        for numero, (repeticoes, peso) in enumerate(zip(item['repeticoes'], item['pesos']), start=1):
+            registro.series.append(SerieArquivada(registro, numero, repeticoes, peso))
+        registros.append(registro)
+    return registros
+
+
+def arquivar_treino(treino):
+    ids = {ex_reg.id_exercicio for ex_reg in treino.exercicios_registrados}
+    treino.arquivo = TreinoArquivado(
+        dados=empacotar(treino),
+        exercicios=[TreinoArquivadoExercicio(id_exercicio=i) for i in sorted(ids)],
+    )
+    treino.exercicios_registrados = []  # delete-orphan remove registros e séries
+
+
+def restaurar_treino(treino):
+    """Devolve um treino arquivado às tabelas quentes. Não faz commit."""
+    if treino.arquivo is None:
+        return False
+    for item in json.loads(treino.arquivo.dados)['exercicios']:
+        ex_reg = ExercicioRegistrado(id_exercicio=item['id_exercicio'], observacoes=item['observacoes'])
+        for numero, (repeticoes, peso) in enumerate(zip(item['repeticoes'], item['pesos']), start=1):
+            ex_reg.series.append(Serie(numero_serie=numero, repeticoes=repeticoes, peso_kg=peso))
+        treino.exercicios_registrados.append(ex_reg)
+    treino.arquivo = None
+    db.session.flush()
+    return True
+
+
+@tarefa('arquivar_treinos')
+def arquivar_treinos(idade_dias=None, usuario=None, lote=100):
+    """Arquiva os treinos finalizados mais antigos que `idade_dias`; devolve quantos."""
+    if idade_dias is None:
+        idade_dias = current_app.config['ARQUIVO_IDADE_DIAS']
+    limite = datetime.utcnow() - timedelta(days=idade_dias)
+    consulta = Treino.query.filter(
+        Treino.data_treino < limite, Treino.hora_fim.isnot(None), ~Treino.arquivo.has()
+    ).order_by(Treino.id)
+    if usuario is not None:
+        consulta = consulta.filter(Treino.id_usuario == usuario)
+    total = 0
+    while True:
+        treinos = consulta.options(
+            joinedload(Treino.exercicios_registrados).joinedload(ExercicioRegistrado.series)
+        ).limit(lote).all()
+        if not treinos:
+            return total
+        for treino in treinos:
+            arquivar_treino(treino)
+        db.session.commit()
+        total += len(treinos)
+
+
+# --- Leitura combinada (tabelas quentes + arquivo) ---
+def _treinos_arquivados_com(id_usuario, exercicio_id):
+    return Treino.query.join(TreinoArquivado).join(TreinoArquivadoExercicio).filter(
+        Treino.id_usuario == id_usuario,
+        TreinoArquivadoExercicio.id_exercicio == exercicio_id
+    ).options(joinedload(Treino.arquivo)).all()
+
+
+def registros_do_exercicio(id_usuario, exercicio_id, mais_recentes_primeiro=True):
+    registros = ExercicioRegistrado.query.join(Treino).filter(
+        ExercicioRegistrado.id_exercicio == exercicio_id,
+        Treino.id_usuario == id_usuario
+    ).options(
+        joinedload(ExercicioRegistrado.series),
+        joinedload(ExercicioRegistrado.treino)
+    ).all()
+    for treino in _treinos_arquivados_com(id_usuario, exercicio_id):
+        registros.extend(desempacotar(treino, id_exercicio=exercicio_id))
+    registros.sort(key=lambda r: r.treino.data_treino, reverse=mais_recentes_primeiro)
+    return registros
+
+
+def registros_do_treino(treino):
+    if treino.arquivo is None:
+        return treino.exercicios_registrados
+    ids = [e.id_exercicio for e in treino.arquivo.exercicios]
+    exercicios_por_id = {e.id: e for e in Exercicio.query.filter(Exercicio.id.in_(ids))} if ids else {}
+    return desempacotar(treino, exercicios_por_id)
+
+
+def exercicio_em_arquivo(id_usuario, exercicio_id):
+    return db.session.query(TreinoArquivadoExercicio.query.join(TreinoArquivado).join(Treino).filter(
+        Treino.id_usuario == id_usuario,
+        TreinoArquivadoExercicio.id_exercicio == exercicio_id
+    ).exists()).scalar()
+
+
+# --- Comandos ---
+def init_arquivo(app):
+    app.cli.add_command(arquivo_cli)
+
+
+arquivo_cli = AppGroup('arquivo', help='Arquiva e restaura treinos antigos.')
+
+
+@arquivo_cli.command('arquivar')
+@click.option('--dias', type=int, default=None, help='Idade mínima do treino (padrão: ARQUIVO_IDADE_DIAS).')
+@click.option('--usuario', 'id_usuario', type=int, default=None, help='Só os treinos deste usuário.')
+@click.option('--fila', is_flag=True, help='Enfileira para o `flask worker` em vez de rodar agora.')
+def arquivar_command(dias, id_usuario, fila):
+    """Compacta treinos finalizados antigos na tabela de arquivo."""
+    if fila:
+        job = enfileirar('arquivar_treinos', id_usuario=id_usuario, idade_dias=dias, usuario=id_usuario)
+        click.echo(f'Job #{job.id} enfileirado.')
+        return
+    click.echo(f'{arquivar_treinos(idade_dias=dias, usuario=id_usuario)} treinos arquivados.')
+
+
+@arquivo_cli.command('restaurar')
+@click.argument('treino_id', type=int)
+def restaurar_command(treino_id):
+    """Devolve um treino arquivado às tabelas normais."""
+    treino = db.session.get(Treino, treino_id)
+    if treino is None:
+        raise click.ClickException(f'Treino #{treino_id} não existe.')
+    if restaurar_treino(treino):
+        db.session.commit()
+        click.echo(f'Treino #{treino_id} restaurado.')
+    else:
+        click.echo(f'Treino #{treino_id} não está arquivado.')
@@ -0,0 +1,95 @@
+# --- Pipeline de Arquivos Estáticos ---
+# `flask assets build` copia cada arquivo de static/ para static/dist/ com o hash do
+# conteúdo no nome, gera as versões .gz/.br e grava um manifest.json. O WhiteNoise
+# serve essas cópias com cache "immutable" e entrega a versão comprimida quando o
+# navegador aceita; `asset_url()` resolve o nome lógico para o nome com hash.
+import hashlib
+import json
+import os
+import re
+import shutil
+
+import click
+from flask import current_app, url_for
+from flask.cli import AppGroup
+from whitenoise import WhiteNoise
+
+PASTA_DIST = 'dist'
+NOME_MANIFEST = 'manifest.json'
+TAMANHO_HASH = 12
+
+_ARQUIVO_COM_HASH = re.compile(r'^/static/%s/.+\.[0-9a-f]{%d}\.\w+$' % (PASTA_DIST, TAMANHO_HASH))
+
+
+def init_assets(app):
+    app.wsgi_app = WhiteNoise(
+        app.wsgi_app,
+        root=app.static_folder,
+        prefix=app.static_url_path,
+        autorefresh=app.debug,
+        immutable_file_test=lambda path, url: bool(_ARQUIVO_COM_HASH.match(url)),
+    )
+    app.extensions['assets_manifest'] = carregar_manifest(app.static_folder)
+    app.add_template_global(asset_url)
+    app.cli.add_command(assets_cli)
+
+
+def carregar_manifest(static_folder):
+    try:
+        with open(os.path.join(static_folder, PASTA_DIST, NOME_MANIFEST), encoding='utf-8') as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return {}
+
+
+def asset_url(filename):
+    """Como url_for('static', filename=...), mas aponta para a cópia com hash quando existe."""
+    manifest = current_app.extensions.get('assets_manifest', {})
+    return url_for('static', filename=manifest.get(filename, filename))
+
+
+def _nome_com_hash(caminho_relativo, conteudo):
+    digest = hashlib.sha256(conteudo).hexdigest()[:TAMANHO_HASH]
+    base, ext = os.path.splitext(caminho_relativo)
+    return f'{base}.{digest}{ext}'
+
+
+def build_assets(static_folder, log=None):
+    # Só o build precisa do compressor (e do brotli); os workers não o importam
+    from whitenoise.compress import Compressor
+
+    pasta_dist = os.path.join(static_folder, PASTA_DIST)
+    shutil.rmtree(pasta_dist, ignore_errors=True)
+    compressor = Compressor(quiet=True)
+    manifest = {}
+    for raiz, pastas, arquivos in os.walk(static_folder):
+        if raiz == static_folder and PASTA_DIST in pastas:
+            pastas.remove(PASTA_DIST)
+        for nome in sorted(arquivos):
+            origem = os.path.join(raiz, nome)
+            relativo = os.path.relpath(origem, static_folder).replace(os.sep, '/')
+            with open(origem, 'rb') as f:
+                conteudo = f.read()
+            destino_relativo = _nome_com_hash(relativo, conteudo)
+            destino = os.path.join(pasta_dist, destino_relativo)
+            os.makedirs(os.path.dirname(destino), exist_ok=True)
+            with open(destino, 'wb') as f:
+                f.write(conteudo)
+            comprimidos = compressor.compress(destino) if compressor.should_compress(destino) else []
+            manifest[relativo] = f'{PASTA_DIST}/{destino_relativo}'
+            if log:
+                extras = ''.join(f' +{os.path.splitext(c)[1]}' for c in comprimidos)
+                log(f'{relativo} -> {manifest[relativo]}{extras}')
+    with open(os.path.join(pasta_dist, NOME_MANIFEST), 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=2, sort_keys=True)
+    return manifest
+
+
+assets_cli = AppGroup('assets', help='Gera os arquivos estáticos com hash e pré-comprimidos.')
+
+
+@assets_cli.command('build')
+def build_command():
+    """Gera static/dist/ (cópias com hash, .gz/.br e manifest.json)."""
+    manifest = build_assets(current_app.static_folder, log=click.echo)
+    click.echo(f'{len(manifest)} arquivos em {PASTA_DIST}/.')
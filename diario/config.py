@@ -0,0 +1,59 @@
+# --- Configurações por Ambiente ---
+import os
+
+
+def _database_url():
+    database_url = os.environ.get('DATABASE_URL')
+    if database_url:
+        return database_url.replace("postgres://", "postgresql://", 1)
+    return "sqlite:///database.db"
+
+
+class Config:
+    SECRET_KEY = os.environ.get('SECRET_KEY')
+    SQLALCHEMY_DATABASE_URI = _database_url()
+    SQLALCHEMY_TRACK_MODIFICATIONS = False
+    DEBUG = False
+    TESTING = False
+
+    # Fila de jobs (flask worker)
+    JOBS_CONCORRENCIA = int(os.environ.get('JOBS_CONCORRENCIA', 2))
+    JOBS_INTERVALO = 1.0          # segundos entre consultas com a fila vazia
+    JOBS_MAX_TENTATIVAS = 3
+    JOBS_ESPERA_BASE = 5          # segundos; dobra a cada nova tentativa
+    JOBS_TIMEOUT = 600            # job 'executando' sem heartbeat há mais tempo volta para a fila
+
+    # Controle de admissão: 'memoria' (por processo), 'sqlite' (instance/limites.db,
+    # compartilhado entre workers) ou 'sqlite:////caminho/absoluto.db'
+    LIMITES_ATIVOS = True
+    LIMITES_BACKEND = os.environ.get('LIMITES_BACKEND', 'sqlite')
+    LIMITES_ROTAS = {}            # nome -> (capacidade, período em segundos)
+    PROXIES_CONFIAVEIS = int(os.environ.get('PROXIES_CONFIAVEIS', 0))
+
+    # Treinos finalizados há mais tempo que isso podem ir para o arquivo (flask arquivo arquivar)
+    ARQUIVO_IDADE_DIAS = int(os.environ.get('ARQUIVO_IDADE_DIAS', 365))
+
+
+class DevelopmentConfig(Config):
+    DEBUG = True
+    SECRET_KEY = os.environ.get('SECRET_KEY', 'SEGREDO')
+
+
+class ProductionConfig(Config):
+    pass
+
+
+class TestingConfig(Config):
+    TESTING = True
+    SECRET_KEY = 'SEGREDO'
+    SQLALCHEMY_DATABASE_URI = "sqlite:///:memory:"
+    BCRYPT_LOG_ROUNDS = 4
+    LIMITES_ATIVOS = False
+    LIMITES_BACKEND = 'memoria'
+
+
+config_por_nome = {
+    'development': DevelopmentConfig,
+    'production': ProductionConfig,
+    'testing': TestingConfig,
+}
@@ -0,0 +1,26 @@
+# --- Extensões (sem app vinculada; ligadas em create_app) ---
+from flask import current_app
+from flask_login import LoginManager
+from flask_sqlalchemy import SQLAlchemy
+
+db = SQLAlchemy()
+
+login_manager = LoginManager()
+login_manager.login_view = 'auth.login'
+login_manager.login_message_category = 'info'
+login_manager.login_message = 'Por favor, faça o login para acessar esta página.'
+
+
+# --- Bcrypt preguiçoso: só é importado no primeiro hash/verificação de senha ---
+def get_bcrypt():
+    bcrypt = current_app.extensions.get('bcrypt')
+    if bcrypt is None:
+        from flask_bcrypt import Bcrypt
+        bcrypt = current_app.extensions['bcrypt'] = Bcrypt(current_app)
+    return bcrypt
+
+
+# --- Migrate preguiçoso: Alembic só é carregado quando a app sobe pelo CLI do Flask ---
+def init_migrate(app):
+    from flask_migrate import Migrate
+    Migrate(app, db)
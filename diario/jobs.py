@@ -0,0 +1,196 @@
+# --- Fila de Jobs em Segundo Plano ---
+# Fila guardada no próprio banco (SQLite ou Postgres), sem broker externo. As rotas
+# chamam `enfileirar()` e respondem na hora; o processo `flask worker` reserva os
+# jobs pendentes, executa a tarefa registrada e faz novas tentativas com espera
+# exponencial quando ela falha.
+import json
+import threading
+import time
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+
+import click
+from flask import current_app
+from sqlalchemy import or_, and_
+
+from .extensions import db
+from .models import Job
+
+TAREFAS = {}
+
+
+def tarefa(nome):
+    """Registra a função como tarefa executável pelo worker."""
+    def decorador(func):
+        TAREFAS[nome] = func
+        return func
+    return decorador
+
+
+def init_jobs(app):
+    app.cli.add_command(worker_command)
+
+
+def enfileirar(nome, id_usuario=None, max_tentativas=None, **payload):
+    if nome not in TAREFAS:
+        raise ValueError(f'Tarefa desconhecida: {nome}')
+    job = Job(
+        tarefa=nome,
+        payload=json.dumps(payload),
+        id_usuario=id_usuario,
+        max_tentativas=max_tentativas or current_app.config['JOBS_MAX_TENTATIVAS'],
+    )
+    db.session.add(job); db.session.commit()
+    return job
+
+
+def job_para_dict(job):
+    return {
+        'id': job.id,
+        'tarefa': job.tarefa,
+        'status': job.status,
+        'tentativas': job.tentativas,
+        'max_tentativas': job.max_tentativas,
+        # O traceback fica no banco e no log do worker; o usuário só vê que falhou
+        'erro': 'Falha ao executar a tarefa.' if job.erro else None,
+        'resultado': json.loads(job.resultado) if job.resultado else None,
+        'criado_em': job.criado_em.isoformat() if job.criado_em else None,
+        'finalizado_em': job.finalizado_em.isoformat() if job.finalizado_em else None,
+    }
+
+
+# --- Execução ---
+def reservar_job():
+    """Marca um job disponível como 'executando' e o devolve (ou None).
+
+    A reserva é um UPDATE condicionado ao status lido, então dois workers nunca
+    pegam o mesmo job, tanto no SQLite quanto no Postgres. Um job em execução
+    renova `visto_em` periodicamente; se ficar sem heartbeat por JOBS_TIMEOUT
+    (worker que morreu) volta a ser elegível, até esgotar max_tentativas.
+    """
+    agora = datetime.utcnow()
+    abandonado = _abandonado(agora)
+    disponiveis = or_(
+        and_(Job.status == 'pendente', Job.executar_apos <= agora),
+        and_(abandonado, Job.tentativas < Job.max_tentativas),
+    )
+    candidatos = db.session.query(Job.id, Job.status).filter(disponiveis).order_by(Job.id).limit(10).all()
+    for job_id, status in candidatos:
+        reservado = Job.query.filter_by(id=job_id, status=status).filter(disponiveis).update(
+            {'status': 'executando', 'iniciado_em': agora, 'visto_em': agora, 'tentativas': Job.tentativas + 1},
+            synchronize_session=False)
+        db.session.commit()
+        if reservado:
+            return db.session.get(Job, job_id)
+    return None
+
+
+def _abandonado(agora):
+    limite = agora - timedelta(seconds=current_app.config['JOBS_TIMEOUT'])
+    return and_(Job.status == 'executando', Job.visto_em < limite)
+
+
+def encerrar_abandonados():
+    """Marca como 'falhou' os jobs abandonados que já esgotaram max_tentativas.
+
+    Roda na partida do worker e depois a cada JOBS_TIMEOUT/3, só na thread
+    principal, para não escrever no banco a cada consulta à fila vazia.
+    """
+    agora = datetime.utcnow()
+    total = Job.query.filter(_abandonado(agora), Job.tentativas >= Job.max_tentativas).update(
+        {'status': 'falhou', 'finalizado_em': agora, 'erro': 'Worker interrompido durante a execução.'},
+        synchronize_session=False)
+    db.session.commit()
+    return total
+
+
+def _heartbeat(app, job_id, parar):
+    intervalo = app.config['JOBS_TIMEOUT'] / 3
+    while not parar.wait(intervalo):
+        with app.app_context():
+            try:
+                Job.query.filter_by(id=job_id, status='executando').update(
+                    {'visto_em': datetime.utcnow()}, synchronize_session=False)
+                db.session.commit()
+            except Exception:
+                db.session.rollback()
+                app.logger.exception('Falha no heartbeat do job #%s.', job_id)
+
+
+def executar_job(job):
+    parar = threading.Event()
+    threading.Thread(target=_heartbeat, args=(current_app._get_current_object(), job.id, parar), daemon=True).start()
+    try:
+        func = TAREFAS[job.tarefa]
+        resultado = func(**json.loads(job.payload))
+    except Exception:
+        db.session.rollback()
+        current_app.logger.exception('Job #%s (%s) falhou na tentativa %s.', job.id, job.tarefa, job.tentativas)
+        job.erro = traceback.format_exc(limit=5)
+        if job.tentativas < job.max_tentativas:
+            espera = current_app.config['JOBS_ESPERA_BASE'] * 2 ** (job.tentativas - 1)
+            job.status = 'pendente'; job.executar_apos = datetime.utcnow() + timedelta(seconds=espera)
+        else:
+            job.status = 'falhou'; job.finalizado_em = datetime.utcnow()
+    else:
+        job.status = 'concluido'; job.erro = None; job.finalizado_em = datetime.utcnow()
+        job.resultado = json.dumps(resultado) if resultado is not None else None
+    finally:
+        parar.set()
+    db.session.commit()
+
+
+def processar_um():
+    """Executa no máximo um job; devolve True se havia trabalho."""
+    job = reservar_job()
+    if job is None:
+        return False
+    executar_job(job)
+    return True
+
+
+def _loop_worker(app, parar, intervalo):
+    while not parar.is_set():
+        with app.app_context():
+            try:
+                trabalhou = processar_um()
+            except Exception:
+                db.session.rollback()
+                app.logger.exception('Erro no loop do worker.')
+                trabalhou = False
+        if not trabalhou:
+            parar.wait(intervalo)
+
+
+@click.command('worker')
+@click.option('--concorrencia', '-c', type=int, default=None, help='Número de threads executando jobs.')
+@click.option('--intervalo', type=float, default=None, help='Segundos entre consultas quando a fila está vazia.')
+@click.option('--uma-vez', is_flag=True, help='Esvazia a fila e sai (útil em cron).')
+def worker_command(concorrencia, intervalo, uma_vez):
+    """Processa a fila de jobs em segundo plano."""
+    app = current_app._get_current_object()
+    encerrar_abandonados()
+    if uma_vez:
+        total = 0
+        while processar_um(): total += 1
+        click.echo(f'{total} jobs processados.')
+        return
+    concorrencia = concorrencia or app.config['JOBS_CONCORRENCIA']
+    intervalo = intervalo or app.config['JOBS_INTERVALO']
+    parar = threading.Event()
+    click.echo(f'Worker iniciado com {concorrencia} threads ({", ".join(sorted(TAREFAS)) or "nenhuma tarefa"}).')
+    with ThreadPoolExecutor(max_workers=concorrencia, thread_name_prefix='worker') as pool:
+        for _ in range(concorrencia):
+            pool.submit(_loop_worker, app, parar, intervalo)
+        varredura = app.config['JOBS_TIMEOUT'] / 3
+        try:
+            while not parar.wait(varredura):
+                try:
+                    encerrar_abandonados()
+                except Exception:
+                    db.session.rollback()
+                    app.logger.exception('Falha ao encerrar jobs abandonados.')
+        except KeyboardInterrupt:
+            click.echo('Encerrando após os jobs em andamento...')
+            parar.set()
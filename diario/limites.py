@@ -0,0 +1,243 @@
+# --- Controle de Admissão (Rate Limit e Concorrência) ---
+# Token bucket por usuário (ou IP, para quem não está logado) com orçamento por
+# rota, e teto de execuções simultâneas por usuário para rotas caras. O estado fica num backend
+# plugável: 'memoria' vale só para o processo e 'sqlite' guarda buckets e vagas num
+# arquivo local compartilhado pelos workers do gunicorn (que, síncronos, atendem uma
+# requisição por processo). Acima do limite a resposta é 429 + Retry-After na hora.
+import math
+import os
+import sqlite3
+import threading
+import time
+import uuid
+from functools import wraps
+
+from flask import current_app, request, jsonify
+from flask_login import current_user
+from werkzeug.exceptions import TooManyRequests
+from werkzeug.middleware.proxy_fix import ProxyFix
+
+
+def init_limites(app):
+    if app.config['PROXIES_CONFIAVEIS']:
+        # Atrás do proxy do Render o remote_addr seria sempre o do proxy
+        n = app.config['PROXIES_CONFIAVEIS']
+        app.wsgi_app = ProxyFix(app.wsgi_app, x_for=n, x_proto=n)
+    app.extensions['limites'] = criar_backend(app)
+    app.register_error_handler(429, resposta_429)
+
+
+def criar_backend(app):
+    nome = app.config['LIMITES_BACKEND']
+    if nome == 'memoria':
+        return MemoriaBackend()
+    if nome == 'sqlite':
+        os.makedirs(app.instance_path, exist_ok=True)
+        return SQLiteBackend(os.path.join(app.instance_path, 'limites.db'))
+    if nome.startswith('sqlite:///'):
+        return SQLiteBackend(nome[len('sqlite:///'):])
+    raise ValueError(f'LIMITES_BACKEND inválido: {nome}')
+
+
+def _token_bucket(estado, capacidade, periodo, agora, custo):
+    """Recarrega o bucket e tenta gastar `custo` fichas.
+
+    Devolve (fichas_restantes, espera): espera é 0 quando a requisição passa,
+    ou os segundos até haver fichas suficientes.
+    """
+    taxa = capacidade / periodo
+    if estado is None:
+        fichas = float(capacidade)
+    else:
+        fichas, atualizado_em = estado
+        fichas = min(capacidade, fichas + (agora - atualizado_em) * taxa)
+    if fichas >= custo:
+        return fichas - custo, 0
+    return fichas, (custo - fichas) / taxa
+
+
+# --- Backends ---
+class MemoriaBackend:
+    LIMPAR_ACIMA_DE = 10000
+
+    def __init__(self):
+        self._buckets = {}
+        self._vagas = {}
+        self._lock = threading.Lock()
+
+    def consumir(self, chave, capacidade, periodo, custo=1):
+        agora = time.time()
+        with self._lock:
+            estado = self._buckets.get(chave)
+            fichas, espera = _token_bucket(estado and estado[:2], capacidade, periodo, agora, custo)
+            self._buckets[chave] = (fichas, agora, periodo)
+            if len(self._buckets) > self.LIMPAR_ACIMA_DE:
+                self._limpar(agora)
+        return espera
+
+    def entrar(self, chave, maximo, validade):
+        """Ocupa uma vaga de `chave`; devolve o ticket ou None se estiver cheia."""
+        agora = time.time()
+        with self._lock:
+            ocupadas = {t: e for t, e in self._vagas.get(chave, {}).items() if e > agora}
+            if len(ocupadas) >= maximo:
+                self._vagas[chave] = ocupadas
+                return None
+            ticket = uuid.uuid4().hex
+            ocupadas[ticket] = agora + validade
+            self._vagas[chave] = ocupadas
+        return ticket
+
+    def sair(self, chave, ticket):
+        with self._lock:
+            self._vagas.get(chave, {}).pop(ticket, None)
+
+    def _limpar(self, agora):
+        # Buckets parados há mais de um período (o de cada um) já estariam cheios de novo
+        for chave, (_, atualizado_em, periodo) in list(self._buckets.items()):
+            if agora - atualizado_em > periodo:
+                del self._buckets[chave]
+
+
+class SQLiteBackend:
+    LIMPAR_A_CADA = 1000
+    MAX_IDADE = 24 * 60 * 60
+
+    def __init__(self, caminho):
+        self.caminho = caminho
+        self._local = threading.local()
+        self._contador = 0
+
+    def _conexao(self):
+        # Uma conexão por thread, aberta só depois do fork do gunicorn
+        conn = getattr(self._local, 'conn', None)
+        if conn is None:
+            conn = sqlite3.connect(self.caminho, timeout=1.0, isolation_level=None)
+            conn.execute('PRAGMA journal_mode=WAL')
+            conn.execute('CREATE TABLE IF NOT EXISTS bucket (chave TEXT PRIMARY KEY, fichas REAL NOT NULL, atualizado_em REAL NOT NULL)')
+            conn.execute('CREATE TABLE IF NOT EXISTS vaga (ticket TEXT PRIMARY KEY, chave TEXT NOT NULL, expira_em REAL NOT NULL)')
+            conn.execute('CREATE INDEX IF NOT EXISTS ix_vaga_chave ON vaga (chave)')
+            self._local.conn = conn
+        return conn
+
+    def consumir(self, chave, capacidade, periodo, custo=1):
+        conn = self._conexao()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            agora = time.time()
+            estado = conn.execute('SELECT fichas, atualizado_em FROM bucket WHERE chave = ?', (chave,)).fetchone()
+            fichas, espera = _token_bucket(estado, capacidade, periodo, agora, custo)
+            conn.execute('INSERT OR REPLACE INTO bucket (chave, fichas, atualizado_em) VALUES (?, ?, ?)', (chave, fichas, agora))
+            self._contador += 1
+            if self._contador % self.LIMPAR_A_CADA == 0:
+                conn.execute('DELETE FROM bucket WHERE atualizado_em < ?', (agora - self.MAX_IDADE,))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return espera
+
+    def entrar(self, chave, maximo, validade):
+        """Ocupa uma vaga de `chave`; devolve o ticket ou None se estiver cheia.
+
+        Vagas expiram após `validade` segundos, então um worker que morre no meio
+        da requisição não deixa a vaga presa para sempre.
+        """
+        conn = self._conexao()
+        conn.execute('BEGIN IMMEDIATE')
+        try:
+            agora = time.time()
+            conn.execute('DELETE FROM vaga WHERE chave = ? AND expira_em <= ?', (chave, agora))
+            (ocupadas,) = conn.execute('SELECT COUNT(*) FROM vaga WHERE chave = ?', (chave,)).fetchone()
+            ticket = None
+            if ocupadas < maximo:
+                ticket = uuid.uuid4().hex
+                conn.execute('INSERT INTO vaga (ticket, chave, expira_em) VALUES (?, ?, ?)', (ticket, chave, agora + validade))
+            conn.execute('COMMIT')
+        except Exception:
+            conn.execute('ROLLBACK')
+            raise
+        return ticket
+
+    def sair(self, chave, ticket):
+        self._conexao().execute('DELETE FROM vaga WHERE ticket = ?', (ticket,))
+
+
+# --- Decoradores de Rota ---
+def _chave_cliente():
+    if current_user.is_authenticated:
+        return f'u:{current_user.id}'
+    return f'ip:{request.remote_addr}'
+
+
+def limite(nome, capacidade, periodo, metodos=None, custo=1):
+    """Aplica um orçamento de `capacidade` requisições a cada `periodo` segundos.
+
+    O orçamento pode ser trocado por configuração em LIMITES_ROTAS[nome].
+    """
+    def decorador(func):
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            config = current_app.config
+            if config['LIMITES_ATIVOS'] and (metodos is None or request.method in metodos):
+                cap, per = config['LIMITES_ROTAS'].get(nome, (capacidade, periodo))
+                try:
+                    espera = current_app.extensions['limites'].consumir(f'{nome}:{_chave_cliente()}', cap, per, custo)
+                except sqlite3.Error:
+                    # Se o backend falhar, deixa passar em vez de derrubar a rota
+                    current_app.logger.exception('Falha no backend de limites.')
+                    espera = 0
+                if espera:
+                    raise TooManyRequests(retry_after=math.ceil(espera))
+            return func(*args, **kwargs)
+        return wrapper
+    return decorador
+
+
+def limite_concorrencia(por_usuario, maximo=None, validade=60):
+    """Recusa com 429 quando o cliente já tem `por_usuario` execuções da rota em andamento.
+
+    `maximo`, se dado, é um teto adicional somando todos os clientes. Com o backend
+    'sqlite' os dois valem para todos os workers da máquina.
+    """
+    def decorador(func):
+        rota = f'concorrencia:{func.__module__}.{func.__name__}'
+
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            if not current_app.config['LIMITES_ATIVOS']:
+                return func(*args, **kwargs)
+            backend = current_app.extensions['limites']
+            vagas = [(f'{rota}:{_chave_cliente()}', por_usuario)]
+            if maximo is not None:
+                vagas.append((rota, maximo))
+            ocupadas = []
+            try:
+                try:
+                    for chave, teto in vagas:
+                        ticket = backend.entrar(chave, teto, validade)
+                        if ticket is None:
+                            raise TooManyRequests(retry_after=1)
+                        ocupadas.append((chave, ticket))
+                except sqlite3.Error:
+                    current_app.logger.exception('Falha no backend de limites.')
+                return func(*args, **kwargs)
+            finally:
+                for chave, ticket in reversed(ocupadas):
+                    try:
+                        backend.sair(chave, ticket)
+                    except sqlite3.Error:
+                        current_app.logger.exception('Falha ao liberar vaga no backend de limites.')
+        return wrapper
+    return decorador
+
+
+def resposta_429(erro):
+    if request.path.startswith('/api/'):
+        resposta = jsonify(erro='Muitas requisições. Tente novamente em instantes.')
+        resposta.status_code = 429
+    else:
+        resposta = erro.get_response()
+    if erro.retry_after is not None:
+        resposta.headers['Retry-After'] = str(erro.retry_after)
+    return resposta
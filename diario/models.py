@@ -0,0 +1,107 @@
+# --- Models ---
+from datetime import datetime
+
+from flask_login import UserMixin
+
+from .extensions import db, login_manager
+
+
+class Usuario(db.Model, UserMixin):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(100), unique=True, nullable=False)
+    senha = db.Column(db.String(100), nullable=False)
+    treinos = db.relationship("Treino", backref="usuario", lazy=True, cascade="all, delete-orphan")
+    medicoes = db.relationship("Medicao", backref="usuario", lazy=True, cascade="all, delete-orphan")
+    templates = db.relationship("TreinoTemplate", backref="usuario", lazy=True, cascade="all, delete-orphan")
+    jobs = db.relationship("Job", backref="usuario", lazy=True, cascade="all, delete-orphan")
+
+class Medicao(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    data_medicao = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    peso_kg = db.Column(db.Float, nullable=False)
+    circunferencia_braco_cm = db.Column(db.Float)
+    circunferencia_cintura_cm = db.Column(db.Float)
+    id_usuario = db.Column(db.Integer, db.ForeignKey("usuario.id"), nullable=False)
+
+class Exercicio(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(100), unique=True, nullable=False)
+    grupo_muscular = db.Column(db.String(50), nullable=False)
+    id_usuario = db.Column(db.Integer, db.ForeignKey('usuario.id'), nullable=False)
+    dono = db.relationship('Usuario', backref=db.backref('exercicios', lazy=True))
+    registros = db.relationship("ExercicioRegistrado", lazy=True)
+    db.UniqueConstraint('nome', 'id_usuario', name='uq_nome_usuario_exercicio')
+
+
+class Treino(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    data_treino = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    hora_inicio = db.Column(db.DateTime)
+    hora_fim = db.Column(db.DateTime)
+    id_usuario = db.Column(db.Integer, db.ForeignKey("usuario.id"), nullable=False)
+    exercicios_registrados = db.relationship("ExercicioRegistrado", backref="treino", lazy=True, cascade="all, delete-orphan")
+    arquivo = db.relationship("TreinoArquivado", backref="treino", uselist=False, lazy=True, cascade="all, delete-orphan")
+
+class ExercicioRegistrado(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    id_treino = db.Column(db.Integer, db.ForeignKey("treino.id"), nullable=False)
+    id_exercicio = db.Column(db.Integer, db.ForeignKey("exercicio.id"), nullable=False)
+    observacoes = db.Column(db.Text, nullable=True)
+    series = db.relationship("Serie", backref="exercicio_registrado", lazy=True, cascade="all, delete-orphan")
+    exercicio = db.relationship("Exercicio", lazy=True)
+
+class Serie(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    numero_serie = db.Column(db.Integer, nullable=False)
+    repeticoes = db.Column(db.Integer, nullable=False)
+    peso_kg = db.Column(db.Float, nullable=False)
+    id_exercicio_registrado = db.Column(db.Integer, db.ForeignKey("exercicio_registrado.id"), nullable=False)
+
+class TreinoArquivado(db.Model):
+    # Treino antigo compactado: exercícios e séries viram um único JSON
+    # ({"exercicios": [{"id_exercicio", "observacoes", "repeticoes": [...], "pesos": [...]}]})
+    # e as linhas de exercicio_registrado/serie são removidas. O Treino continua na tabela quente.
+    id_treino = db.Column(db.Integer, db.ForeignKey("treino.id"), primary_key=True)
+    dados = db.Column(db.Text, nullable=False)
+    arquivado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    exercicios = db.relationship("TreinoArquivadoExercicio", lazy=True, cascade="all, delete-orphan")
+
+class TreinoArquivadoExercicio(db.Model):
+    # Índice dos exercícios de cada treino arquivado, para filtrar sem abrir o JSON
+    id_treino = db.Column(db.Integer, db.ForeignKey("treino_arquivado.id_treino"), primary_key=True)
+    id_exercicio = db.Column(db.Integer, db.ForeignKey("exercicio.id"), primary_key=True, index=True)
+
+class TreinoTemplate(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    nome = db.Column(db.String(150), nullable=False)
+    id_usuario = db.Column(db.Integer, db.ForeignKey('usuario.id'), nullable=False)
+    exercicios_template = db.relationship('TemplateExercicio', backref='template', lazy=True, cascade="all, delete-orphan")
+    db.UniqueConstraint('nome', 'id_usuario', name='uq_nome_usuario_template')
+
+class TemplateExercicio(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    ordem = db.Column(db.Integer)
+    id_template = db.Column(db.Integer, db.ForeignKey('treino_template.id'), nullable=False)
+    id_exercicio = db.Column(db.Integer, db.ForeignKey('exercicio.id'), nullable=False)
+    exercicio = db.relationship('Exercicio', lazy=True)
+
+class Job(db.Model):
+    id = db.Column(db.Integer, primary_key=True)
+    tarefa = db.Column(db.String(100), nullable=False)
+    payload = db.Column(db.Text, nullable=False, default='{}')
+    status = db.Column(db.String(20), nullable=False, default='pendente', index=True)
+    tentativas = db.Column(db.Integer, nullable=False, default=0)
+    max_tentativas = db.Column(db.Integer, nullable=False, default=3)
+    erro = db.Column(db.Text)
+    resultado = db.Column(db.Text)
+    criado_em = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    executar_apos = db.Column(db.DateTime, nullable=False, default=datetime.utcnow)
+    iniciado_em = db.Column(db.DateTime)
+    visto_em = db.Column(db.DateTime)  # heartbeat do worker enquanto executa
+    finalizado_em = db.Column(db.DateTime)
+    id_usuario = db.Column(db.Integer, db.ForeignKey('usuario.id'), nullable=True, index=True)
+
+# --- Carregador de Usuário (User Loader) ---
+@login_manager.user_loader
+def load_user(user_id):
+    return Usuario.query.get(int(user_id))
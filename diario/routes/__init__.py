@@ -0,0 +1,4 @@
+# --- Blueprints da Aplicação ---
+from . import auth, exercicios, medicoes, treinos, templates, jobs
+
+blueprints = (auth.bp, exercicios.bp, medicoes.bp, treinos.bp, templates.bp, jobs.bp)
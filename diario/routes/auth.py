@@ -0,0 +1,43 @@
+# --- Rotas de Autenticação ---
+from flask import Blueprint, render_template, request, redirect, url_for, flash
+from flask_login import login_user, logout_user, login_required, current_user
+
+from ..extensions import db, get_bcrypt
+from ..limites import limite
+from ..models import Usuario
+
+bp = Blueprint('auth', __name__)
+
+
+@bp.route('/register', methods=['GET', 'POST'])
+@limite('register', capacidade=5, periodo=3600, metodos=('POST',))
+def register():
+    if current_user.is_authenticated: return redirect(url_for('treinos.index'))
+    if request.method == 'POST':
+        nome_usuario = request.form.get('nome'); senha_plana = request.form.get('senha')
+        if not nome_usuario or not senha_plana: flash('Nome e senha são obrigatórios.', 'error'); return redirect(url_for('auth.register'))
+        usuario_existente = Usuario.query.filter_by(nome=nome_usuario).first()
+        if usuario_existente: flash('Nome de usuário já em uso.', 'error'); return redirect(url_for('auth.register'))
+        senha_hash = get_bcrypt().generate_password_hash(senha_plana).decode('utf-8')
+        novo_usuario = Usuario(nome=nome_usuario, senha=senha_hash)
+        db.session.add(novo_usuario); db.session.commit()
+        flash('Conta criada! Por favor, faça o login.', 'success'); return redirect(url_for('auth.login'))
+    return render_template('register.html')
+
+@bp.route('/login', methods=['GET', 'POST'])
+@limite('login', capacidade=5, periodo=60, metodos=('POST',))
+def login():
+    if current_user.is_authenticated: return redirect(url_for('treinos.index'))
+    if request.method == 'POST':
+        nome_usuario = request.form.get('nome'); senha_plana = request.form.get('senha')
+        usuario = Usuario.query.filter_by(nome=nome_usuario).first()
+        if usuario and get_bcrypt().check_password_hash(usuario.senha, senha_plana):
+            login_user(usuario, remember=True); flash('Login realizado com sucesso!', 'success')
+            next_page = request.args.get('next'); return redirect(next_page) if next_page else redirect(url_for('treinos.index'))
+        else: flash('Login falhou. Verifique usuário e senha.', 'error')
+    return render_template('login.html')
+
+@bp.route('/logout')
+@login_required
+def logout():
+    logout_user(); flash('Você saiu da sua conta.', 'info'); return redirect(url_for('auth.login'))
@@ -0,0 +1,86 @@
+# --- Rotas de Exercício (Biblioteca - Global) ---
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, abort
+from flask_login import login_required, current_user
+
+from ..arquivo import registros_do_exercicio, exercicio_em_arquivo
+from ..extensions import db
+from ..limites import limite, limite_concorrencia
+from ..models import Exercicio, ExercicioRegistrado
+
+bp = Blueprint('exercicios', __name__)
+
+
+@bp.route("/add_exercicio", methods=["GET", "POST"])
+@login_required
+def add_exercicio():
+    if request.method == "POST":
+        nome = request.form.get("nome_exercicio")
+        grupo = request.form.get("grupo_muscular")
+        exercicio_existente = Exercicio.query.filter_by(nome=nome, id_usuario=current_user.id).first()
+        if exercicio_existente:
+            flash(f'Erro: Você já cadastrou o exercício "{nome}".', 'error')
+        elif not nome or not grupo:
+            flash(f'Erro: Campos obrigatórios.', 'error')
+        else:
+            novo_exercicio = Exercicio(nome=nome, 
+                                     grupo_muscular=grupo, 
+                                     id_usuario=current_user.id)
+            db.session.add(novo_exercicio)
+            db.session.commit()
+            flash(f'Exercício "{nome}" cadastrado!', 'success')
+        return redirect(url_for("exercicios.add_exercicio"))
+    return render_template("add_exercicio.html")
+
+@bp.route('/exercicio/<int:exercicio_id>/delete', methods=['POST'])
+@login_required
+def delete_exercicio_biblioteca(exercicio_id):
+    exercicio_para_excluir = Exercicio.query.get_or_404(exercicio_id)
+    if exercicio_para_excluir.id_usuario != current_user.id:
+        abort(403)
+    registros_associados = ExercicioRegistrado.query.filter_by(id_exercicio=exercicio_id).count()
+    if registros_associados > 0 or exercicio_em_arquivo(current_user.id, exercicio_id):
+        flash(f'Erro: Exercício "{exercicio_para_excluir.nome}" está usado em treinos e não pode ser excluído.', 'error')
+    else:
+        db.session.delete(exercicio_para_excluir)
+        db.session.commit()
+        flash(f'Exercício "{exercicio_para_excluir.nome}" excluído.', 'success')
+    return redirect(url_for('treinos.index'))
+
+@bp.route('/exercicio/<int:exercicio_id>/detalhes')
+@login_required
+def ver_exercicio_detalhes(exercicio_id):
+    exercicio = Exercicio.query.get_or_404(exercicio_id)
+    if exercicio.id_usuario != current_user.id:
+        abort(403)
+    registros = registros_do_exercicio(current_user.id, exercicio_id)
+    serie_recorde = None
+    max_peso_encontrado = 0 
+    if registros: 
+        for registro in registros:
+            for serie in registro.series:
+                if serie.peso_kg is not None and serie.peso_kg > max_peso_encontrado: 
+                    max_peso_encontrado = serie.peso_kg
+                    serie_recorde = serie
+    return render_template(
+        'exercicio_detalhes.html', 
+        exercicio=exercicio, 
+        registros=registros, 
+        recorde=serie_recorde
+    )
+
+@bp.route('/api/exercicio/<int:exercicio_id>/progressao')
+@login_required
+@limite('api_graficos', capacidade=30, periodo=60)
+@limite_concorrencia(2, maximo=8)
+def api_exercicio_progressao(exercicio_id):
+    registros = registros_do_exercicio(current_user.id, exercicio_id, mais_recentes_primeiro=False)
+    max_peso_por_data = {}
+    for registro in registros:
+        data_str = registro.treino.data_treino.strftime('%d/%m/%Y'); max_peso_neste_dia = 0
+        pesos_validos = [s.peso_kg for s in registro.series if s.peso_kg is not None] 
+        if pesos_validos: max_peso_neste_dia = max(pesos_validos) 
+        if max_peso_neste_dia > 0:
+            if data_str not in max_peso_por_data or max_peso_neste_dia > max_peso_por_data[data_str]:
+                max_peso_por_data[data_str] = max_peso_neste_dia
+    datas = list(max_peso_por_data.keys()); pesos_maximos = list(max_peso_por_data.values())
+    return jsonify(labels=datas, data=pesos_maximos)
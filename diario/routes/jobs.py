@@ -0,0 +1,22 @@
+# --- Rotas de Status dos Jobs (User-Specific) ---
+from flask import Blueprint, jsonify, abort
+from flask_login import login_required, current_user
+
+from ..jobs import job_para_dict
+from ..models import Job
+
+bp = Blueprint('jobs', __name__)
+
+
+@bp.route('/api/jobs')
+@login_required
+def api_jobs():
+    jobs = Job.query.filter_by(id_usuario=current_user.id).order_by(Job.id.desc()).limit(20).all()
+    return jsonify(jobs=[job_para_dict(j) for j in jobs])
+
+@bp.route('/api/jobs/<int:job_id>')
+@login_required
+def api_job_status(job_id):
+    job = Job.query.get_or_404(job_id)
+    if job.id_usuario != current_user.id: abort(403)
+    return jsonify(job_para_dict(job))
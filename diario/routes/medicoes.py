@@ -0,0 +1,67 @@
+# --- Rotas de Medição (User-Specific) ---
+from flask import Blueprint, render_template, request, redirect, url_for, flash, jsonify, abort
+from flask_login import login_required, current_user
+
+from ..extensions import db
+from ..limites import limite, limite_concorrencia
+from ..models import Medicao
+
+bp = Blueprint('medicoes', __name__)
+
+
+@bp.route('/add_medicao', methods=['GET', 'POST'])
+@login_required
+@limite('escrita', capacidade=60, periodo=60, metodos=('POST',))
+def add_medicao():
+    if request.method == 'POST':
+        peso = request.form.get('peso_kg'); braco = request.form.get('circunferencia_braco_cm'); cintura = request.form.get('circunferencia_cintura_cm')
+        if not peso: flash('Erro: Peso obrigatório.', 'error'); return redirect(url_for('medicoes.add_medicao'))
+        try: peso_float = float(peso); braco_float = float(braco) if braco else None; cintura_float = float(cintura) if cintura else None
+        except ValueError: flash('Erro: Valores numéricos inválidos.', 'error'); return redirect(url_for('medicoes.add_medicao'))
+        nova_medicao = Medicao(id_usuario=current_user.id, peso_kg=peso_float, circunferencia_braco_cm=braco_float, circunferencia_cintura_cm=cintura_float)
+        db.session.add(nova_medicao); db.session.commit(); flash('Medição registrada!', 'success')
+        return redirect(url_for('medicoes.add_medicao'))
+    return render_template('add_medicao.html')
+
+@bp.route('/historico_medicoes')
+@login_required
+def historico_medicoes():
+    medicoes_passadas = Medicao.query.filter_by(id_usuario=current_user.id).order_by(Medicao.data_medicao.desc()).all()
+    return render_template('historico_medicoes.html', medicoes=medicoes_passadas)
+
+@bp.route('/api/peso_historico')
+@login_required
+@limite('api_graficos', capacidade=30, periodo=60)
+@limite_concorrencia(2, maximo=8)
+def api_peso_historico():
+    medicoes = Medicao.query.filter_by(id_usuario=current_user.id).order_by(Medicao.data_medicao.asc()).all()
+    datas = [m.data_medicao.strftime('%d/%m/%Y') for m in medicoes]; pesos = [m.peso_kg for m in medicoes]
+    return jsonify(labels=datas, data=pesos)
+
+@bp.route('/medicao/<int:medicao_id>/edit', methods=['GET'])
+@login_required
+def edit_medicao_page(medicao_id):
+    medicao_para_editar = Medicao.query.get_or_404(medicao_id)
+    if medicao_para_editar.id_usuario != current_user.id: abort(403)
+    return render_template('edit_medicao.html', medicao=medicao_para_editar)
+
+@bp.route('/medicao/<int:medicao_id>/update', methods=['POST'])
+@login_required
+def update_medicao(medicao_id):
+    medicao_para_atualizar = Medicao.query.get_or_404(medicao_id)
+    if medicao_para_atualizar.id_usuario != current_user.id: abort(403)
+    novo_peso = request.form.get('peso_kg'); novo_braco = request.form.get('circunferencia_braco_cm'); novo_cintura = request.form.get('circunferencia_cintura_cm')
+    if not novo_peso: flash('Erro: Peso obrigatório.', 'error'); return redirect(url_for('medicoes.edit_medicao_page', medicao_id=medicao_id))
+    try: peso_float = float(novo_peso); braco_float = float(novo_braco) if novo_braco else None; cintura_float = float(novo_cintura) if novo_cintura else None
+    except ValueError: flash('Erro: Valores numéricos inválidos.', 'error'); return redirect(url_for('medicoes.edit_medicao_page', medicao_id=medicao_id))
+    medicao_para_atualizar.peso_kg = peso_float; medicao_para_atualizar.circunferencia_braco_cm = braco_float; medicao_para_atualizar.circunferencia_cintura_cm = cintura_float
+    db.session.commit(); flash('Medição atualizada!', 'success'); return redirect(url_for('medicoes.historico_medicoes'))
+
+@bp.route('/medicao/<int:medicao_id>/delete', methods=['POST'])
+@login_required
+def delete_medicao(medicao_id):
+    medicao_para_excluir = Medicao.query.get_or_404(medicao_id)
+    if medicao_para_excluir.id_usuario != current_user.id: abort(403)
+    try: db.session.delete(medicao_para_excluir); db.session.commit(); flash('Medição excluída.', 'success')
+    except Exception as e: db.session.rollback(); flash(f'Erro: {e}', 'error')
+    return redirect(url_for('medicoes.historico_medicoes'))
@@ -0,0 +1,87 @@
+# --- Rotas de Modelos de Treino (User-Specific) ---
+from flask import Blueprint, render_template, request, redirect, url_for, flash, abort
+from flask_login import login_required, current_user
+
+from ..extensions import db
+from ..models import Exercicio, TreinoTemplate, TemplateExercicio
+
+bp = Blueprint('templates', __name__)
+
+
+@bp.route('/templates', methods=['GET', 'POST'])
+@login_required
+def gerenciar_templates():
+    if request.method == 'POST':
+        nome_template = request.form.get('nome_template')
+        if not nome_template:
+            flash('Erro: O nome do modelo é obrigatório.', 'error')
+            return redirect(url_for('templates.gerenciar_templates'))
+        template_existente = TreinoTemplate.query.filter_by(
+            nome=nome_template, 
+            id_usuario=current_user.id
+        ).first()
+        
+        if template_existente:
+            flash(f'Erro: Um modelo com o nome "{nome_template}" já existe.', 'error')
+        else:
+            novo_template = TreinoTemplate(nome=nome_template, id_usuario=current_user.id)
+            db.session.add(novo_template)
+            db.session.commit()
+            flash(f'Modelo "{nome_template}" criado com sucesso!', 'success')
+        return redirect(url_for('templates.gerenciar_templates'))
+    templates = TreinoTemplate.query.filter_by(id_usuario=current_user.id).order_by(TreinoTemplate.nome).all()
+    return render_template('templates.html', templates=templates)
+
+@bp.route('/template/<int:template_id>/edit', methods=['GET', 'POST'])
+@login_required
+def edit_template_page(template_id):
+    template = TreinoTemplate.query.get_or_404(template_id)
+    if template.id_usuario != current_user.id:
+        abort(403)
+    if request.method == 'POST':
+        exercicio_id = request.form.get('exercicio_id')
+        if not exercicio_id:
+            flash('Erro: Selecione um exercício.', 'error')
+            return redirect(url_for('templates.edit_template_page', template_id=template_id))
+        exercicio_existente = TemplateExercicio.query.filter_by(id_template=template_id, id_exercicio=exercicio_id).first()
+        if exercicio_existente:
+            flash('Exercício já está no modelo.', 'info')
+        else:
+            novo_template_ex = TemplateExercicio(id_template=template_id, id_exercicio=exercicio_id)
+            db.session.add(novo_template_ex)
+            db.session.commit()
+            flash('Exercício adicionado!', 'success')
+        return redirect(url_for('templates.edit_template_page', template_id=template_id))
+    biblioteca_exercicios = Exercicio.query.filter_by(id_usuario=current_user.id).order_by(Exercicio.nome).all()
+    return render_template('edit_template.html', template=template, biblioteca=biblioteca_exercicios)
+
+@bp.route('/template_exercicio/<int:te_id>/delete', methods=['POST'])
+@login_required
+def delete_template_exercicio(te_id):
+    ex_para_remover = TemplateExercicio.query.get_or_404(te_id)
+    template_id = ex_para_remover.id_template
+    if ex_para_remover.template.id_usuario != current_user.id:
+        abort(403)
+    try:
+        db.session.delete(ex_para_remover)
+        db.session.commit()
+        flash('Exercício removido do modelo.', 'success')
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Erro ao remover exercício: {e}', 'error')
+    return redirect(url_for('templates.edit_template_page', template_id=template_id))
+
+@bp.route('/template/<int:template_id>/delete', methods=['POST'])
+@login_required
+def delete_template(template_id):
+    template_para_excluir = TreinoTemplate.query.get_or_404(template_id)
+    if template_para_excluir.id_usuario != current_user.id:
+        abort(403)
+    try:
+        db.session.delete(template_para_excluir)
+        db.session.commit()
+        flash(f'Modelo "{template_para_excluir.nome}" excluído com sucesso.', 'success')
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Erro ao excluir o modelo: {e}', 'error')
+    return redirect(url_for('templates.gerenciar_templates'))
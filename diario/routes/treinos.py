@@ -0,0 +1,202 @@
+# --- Rotas de Treino (User-Specific) ---
+from datetime import datetime
+
+from flask import Blueprint, render_template, request, redirect, url_for, flash, abort
+from flask_login import login_required, current_user
+from sqlalchemy.orm import joinedload
+
+from ..arquivo import registros_do_treino, restaurar_treino
+from ..extensions import db
+from ..limites import limite
+from ..models import Exercicio, Treino, ExercicioRegistrado, Serie, TreinoTemplate
+
+bp = Blueprint('treinos', __name__)
+
+
+@bp.route("/")
+@login_required
+def index():
+    lista_de_exercicios = Exercicio.query.filter_by(id_usuario=current_user.id).all()
+    lista_de_treinos = Treino.query.filter_by(id_usuario=current_user.id).order_by(Treino.data_treino.desc()).all()
+    lista_de_templates = TreinoTemplate.query.filter_by(id_usuario=current_user.id).order_by(TreinoTemplate.nome).all()
+    treino_ativo = Treino.query.filter_by(id_usuario=current_user.id, hora_fim=None).order_by(Treino.id.desc()).first()
+    return render_template("index.html", exercicios=lista_de_exercicios, treinos=lista_de_treinos, templates=lista_de_templates, treino_ativo=treino_ativo)
+
+@bp.route("/novo_treino", methods=['GET', 'POST'])
+@login_required
+@limite('escrita', capacidade=60, periodo=60)
+def novo_treino():
+    template_id = None
+    if request.method == 'POST':
+        template_id_str = request.form.get('template_id')
+        if template_id_str:
+            try: template_id = int(template_id_str)
+            except ValueError: flash('ID de modelo inválido.', 'error'); return redirect(url_for('treinos.index'))
+    novo_treino_obj = Treino(id_usuario=current_user.id, hora_inicio=datetime.utcnow()); db.session.add(novo_treino_obj); db.session.flush()
+    if template_id:
+        template_selecionado = TreinoTemplate.query.get(template_id)
+        if template_selecionado and template_selecionado.id_usuario == current_user.id:
+            for template_ex in template_selecionado.exercicios_template:
+                novo_ex_reg = ExercicioRegistrado(id_treino=novo_treino_obj.id, id_exercicio=template_ex.id_exercicio); db.session.add(novo_ex_reg)
+            flash(f'Treino iniciado com modelo "{template_selecionado.nome}".', 'info')
+        else: flash(f'Modelo não encontrado ou não pertence a você.', 'error')
+    db.session.commit()
+    return redirect(url_for('treinos.ver_treino', treino_id=novo_treino_obj.id))
+
+@bp.route("/treino/<int:treino_id>")
+@login_required
+def ver_treino(treino_id):
+    treino_atual = Treino.query.get_or_404(treino_id);
+    if treino_atual.id_usuario != current_user.id: abort(403)
+    todos_exercicios_biblioteca = Exercicio.query.filter_by(id_usuario=current_user.id).all() 
+    return render_template("treino.html", treino=treino_atual, registros=registros_do_treino(treino_atual), biblioteca=todos_exercicios_biblioteca)
+
+@bp.route("/treino/<int:treino_id>/add_exercicio_reg", methods=["POST"])
+@login_required
+def add_exercicio_reg(treino_id):
+    treino = Treino.query.get_or_404(treino_id)
+    if treino.id_usuario != current_user.id: abort(403)
+    if restaurar_treino(treino): db.session.commit()
+    exercicio_id = request.form.get("exercicio_id")
+    exercicio_existente = ExercicioRegistrado.query.filter_by(id_treino=treino_id, id_exercicio=exercicio_id).first()
+    if not exercicio_existente: novo_exercicio_registrado = ExercicioRegistrado(id_treino=treino_id, id_exercicio=exercicio_id); db.session.add(novo_exercicio_registrado); db.session.commit()
+    return redirect(url_for("treinos.ver_treino", treino_id=treino_id))
+
+@bp.route('/exercicio_reg/<int:ex_reg_id>/add_serie', methods=['POST'])
+@login_required
+@limite('escrita', capacidade=60, periodo=60)
+def add_serie(ex_reg_id):
+    exercicio_registrado = ExercicioRegistrado.query.get_or_404(ex_reg_id)
+    if exercicio_registrado.treino.id_usuario != current_user.id: abort(403)
+    repeticoes_str=request.form.get('repeticoes'); peso_kg_str=request.form.get('peso_kg'); treino_id = exercicio_registrado.treino.id
+    try:
+        repeticoes=int(repeticoes_str); peso_kg=float(peso_kg_str)
+        if repeticoes<1 or repeticoes>99 or peso_kg<0 or peso_kg>999: raise ValueError("Fora do limite")
+    except (ValueError, TypeError): flash('Erro: Reps 1-99, Peso 0-999.', 'error'); return redirect(url_for('treinos.ver_treino', treino_id=treino_id))
+    numero_da_nova_serie=len(exercicio_registrado.series)+1; nova_serie=Serie(id_exercicio_registrado=ex_reg_id, numero_serie=numero_da_nova_serie, repeticoes=repeticoes, peso_kg=peso_kg); db.session.add(nova_serie); db.session.commit()
+    return redirect(url_for('treinos.ver_treino', treino_id=treino_id))
+
+@bp.route('/serie/<int:serie_id>/delete', methods=['POST'])
+@login_required
+def delete_serie(serie_id):
+    serie_para_excluir = Serie.query.get_or_404(serie_id)
+    if serie_para_excluir.exercicio_registrado.treino.id_usuario != current_user.id: abort(403)
+    treino_id=serie_para_excluir.exercicio_registrado.treino.id; db.session.delete(serie_para_excluir); db.session.commit()
+    return redirect(url_for('treinos.ver_treino', treino_id=treino_id))
+
+@bp.route('/serie/<int:serie_id>/edit', methods=['GET'])
+@login_required
+def edit_serie_page(serie_id):
+    serie_para_editar = Serie.query.get_or_404(serie_id)
+    if serie_para_editar.exercicio_registrado.treino.id_usuario != current_user.id: abort(403)
+    return render_template('edit_serie.html', serie=serie_para_editar)
+
+@bp.route('/serie/<int:serie_id>/update', methods=['POST'])
+@login_required
+def update_serie(serie_id):
+    serie_para_atualizar = Serie.query.get_or_404(serie_id)
+    if serie_para_atualizar.exercicio_registrado.treino.id_usuario != current_user.id: abort(403)
+    novas_repeticoes_str=request.form.get('repeticoes'); novo_peso_kg_str=request.form.get('peso_kg'); treino_id = serie_para_atualizar.exercicio_registrado.treino.id
+    try:
+        novas_repeticoes=int(novas_repeticoes_str); novo_peso_kg=float(novo_peso_kg_str)
+        if novas_repeticoes<1 or novas_repeticoes>99 or novo_peso_kg<0 or novo_peso_kg>999: raise ValueError("Fora do limite")
+    except (ValueError, TypeError): flash('Erro: Reps 1-99, Peso 0-999.', 'error'); return redirect(url_for('treinos.edit_serie_page', serie_id=serie_id))
+    serie_para_atualizar.repeticoes=novas_repeticoes; serie_para_atualizar.peso_kg=novo_peso_kg; db.session.commit(); flash(f'Série #{serie_para_atualizar.numero_serie} atualizada!', 'success')
+    return redirect(url_for('treinos.ver_treino', treino_id=treino_id))
+
+@bp.route("/exercicio_reg/<int:ex_reg_id>/delete", methods=["POST"])
+@login_required
+def delete_exercicio_reg(ex_reg_id):
+    ex_reg_para_excluir = ExercicioRegistrado.query.get_or_404(ex_reg_id)
+    if ex_reg_para_excluir.treino.id_usuario != current_user.id: abort(403)
+    treino_id=ex_reg_para_excluir.treino.id
+    for serie in ex_reg_para_excluir.series: db.session.delete(serie)
+    db.session.delete(ex_reg_para_excluir); db.session.commit()
+    return redirect(url_for('treinos.ver_treino', treino_id=treino_id))
+
+@bp.route('/exercicio_reg/<int:ex_reg_id>/update_obs', methods=['POST'])
+@login_required
+def update_observacao(ex_reg_id):
+    ex_reg = ExercicioRegistrado.query.get_or_404(ex_reg_id)
+    if ex_reg.treino.id_usuario != current_user.id: abort(403)
+    nova_observacao = request.form.get('observacoes'); ex_reg.observacoes = nova_observacao; db.session.commit()
+    flash('Observação salva com sucesso!', 'success')
+    return redirect(url_for('treinos.ver_treino', treino_id=ex_reg.treino.id))
+
+@bp.route('/treino/<int:treino_id>/finalizar', methods=['POST'])
+@login_required
+def finalizar_treino(treino_id):
+    treino_para_finalizar = Treino.query.get_or_404(treino_id)
+    if treino_para_finalizar.id_usuario != current_user.id: abort(403)
+    if treino_para_finalizar.hora_fim is None: treino_para_finalizar.hora_fim=datetime.utcnow(); db.session.commit(); flash(f'Treino #{treino_id} finalizado!', 'success')
+    else: flash(f'Treino #{treino_id} já finalizado.', 'info')
+    return redirect(url_for('treinos.sumario_treino', treino_id=treino_id))
+
+@bp.route('/treino/<int:treino_id>/sumario')
+@login_required
+def sumario_treino(treino_id):
+    treino = Treino.query.options(joinedload(Treino.exercicios_registrados).joinedload(ExercicioRegistrado.series), joinedload(Treino.exercicios_registrados).joinedload(ExercicioRegistrado.exercicio)).get_or_404(treino_id)
+    if treino.id_usuario != current_user.id: abort(403)
+    duracao_total_str = "N/A"; volume_total = 0; total_series = 0; total_repeticoes = 0
+    if treino.hora_inicio and treino.hora_fim:
+        duracao = treino.hora_fim - treino.hora_inicio; total_minutos = int(duracao.total_seconds() // 60)
+        if total_minutos < 1: total_segundos = int(duracao.total_seconds() % 60); duracao_total_str = f"{total_segundos} segundos"
+        else: duracao_total_str = f"{total_minutos} minutos"
+    registros = registros_do_treino(treino)
+    for ex_reg in registros:
+        total_series += len(ex_reg.series)
+        for serie in ex_reg.series:
+            if serie.peso_kg is not None and serie.repeticoes is not None: volume_total += (serie.peso_kg * serie.repeticoes)
+            if serie.repeticoes is not None: total_repeticoes += serie.repeticoes
+    return render_template('sumario_treino.html', treino=treino, registros=registros, duracao=duracao_total_str, volume=volume_total, series=total_series, repeticoes=total_repeticoes)
+
+@bp.route('/treino/<int:treino_id>/delete', methods=['POST'])
+@login_required
+def delete_treino(treino_id):
+    treino_para_excluir = Treino.query.get_or_404(treino_id)
+    if treino_para_excluir.id_usuario != current_user.id:
+        abort(403)
+    try:
+        for ex_reg in treino_para_excluir.exercicios_registrados:
+            for serie in ex_reg.series: db.session.delete(serie)
+            db.session.delete(ex_reg)
+        db.session.delete(treino_para_excluir); db.session.commit(); flash(f'Treino #{treino_id} excluído!', 'success')
+    except Exception as e: db.session.rollback(); flash(f'Erro: {e}', 'error')
+    return redirect(url_for('treinos.index'))
+
+@bp.route('/treino/<int:treino_id>/copy', methods=['POST'])
+@login_required
+@limite('copiar_treino', capacidade=10, periodo=60)
+def copy_treino(treino_id):
+    treino_original = Treino.query.options(
+        joinedload(Treino.exercicios_registrados).joinedload(ExercicioRegistrado.series)
+    ).get_or_404(treino_id)
+    if treino_original.id_usuario != current_user.id:
+        abort(403)
+    novo_treino = Treino(id_usuario=current_user.id, hora_inicio=datetime.utcnow())
+    db.session.add(novo_treino)
+    db.session.flush()
+    try:
+        for ex_reg_original in registros_do_treino(treino_original):
+            novo_ex_reg = ExercicioRegistrado(
+                id_treino=novo_treino.id,
+                id_exercicio=ex_reg_original.id_exercicio, 
+                observacoes=ex_reg_original.observacoes
+            )
+            db.session.add(novo_ex_reg)
+            db.session.flush()
+            for serie_original in ex_reg_original.series:
+                nova_serie = Serie(
+                    id_exercicio_registrado=novo_ex_reg.id, 
+                    numero_serie=serie_original.numero_serie, 
+                    repeticoes=serie_original.repeticoes, 
+                    peso_kg=serie_original.peso_kg
+                )
+                db.session.add(nova_serie)
+        db.session.commit()
+        flash(f'Treino #{treino_original.id} copiado para o novo Treino #{novo_treino.id}!', 'success')
+        return redirect(url_for('treinos.ver_treino', treino_id=novo_treino.id))
+    except Exception as e:
+        db.session.rollback()
+        flash(f'Erro ao copiar o treino: {e}', 'error')
+        return redirect(url_for('treinos.index'))